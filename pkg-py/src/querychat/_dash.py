@@ -483,9 +483,8 @@ def register_app_callbacks(
         nw_df = as_narwhals(state.get_current_data())
         nrow, ncol = nw_df.shape
 
-        display_df = nw_df.to_pandas()
-        table_data = display_df.to_dict("records")
-        table_columns = [{"field": col} for col in display_df.columns]
+        table_data = nw_df.rows(named=True)
+        table_columns = [{"field": col} for col in nw_df.columns]
 
         data_info_parts = []
         if state.error:
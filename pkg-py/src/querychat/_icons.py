@@ -1,3 +1,4 @@
+import functools
 from typing import Literal
 
 from shiny import ui
@@ -17,12 +18,17 @@ ICON_NAMES = Literal[
 
 def bs_icon(name: ICON_NAMES, cls: str = "") -> ui.HTML:
     """Get Bootstrap icon SVG by name."""
+    return ui.HTML(_icon_svg(name, cls))
+
+
+@functools.cache
+def _icon_svg(name: str, cls: str) -> str:
     if name not in BS_ICONS:
         raise ValueError(f"Unknown Bootstrap icon: {name}")
     svg = BS_ICONS[name]
     if cls:
         svg = svg.replace('class="', f'class="{cls} ', 1)
-    return ui.HTML(svg)
+    return svg
 
 
 BS_ICONS = {
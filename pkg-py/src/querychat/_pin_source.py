@@ -15,7 +15,7 @@ from ._datasource import (
     duckdb_lock_down,
     format_schema,
 )
-from ._utils import check_query
+from ._utils import TABLE_NAME_PATTERN, check_query
 
 if TYPE_CHECKING:
     from pins.boards import BaseBoard
@@ -39,7 +39,7 @@ DUCKDB_READER_FN = {
 
 
 def _sanitize_table_name(name: str) -> str:
-    if re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", name):
+    if TABLE_NAME_PATTERN.match(name):
         return name
     out = re.sub(r"[^a-zA-Z0-9_]", "_", name)
     if not re.match(r"^[a-zA-Z]", out):
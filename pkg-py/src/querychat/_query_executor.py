@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 import duckdb
@@ -10,6 +11,7 @@ import narwhals.stable.v1 as nw
 
 from ._datasource import (
     ColumnMeta,
+    DataFrameSource,
     MissingColumnsError,
     duckdb_column_meta,
     duckdb_column_stats,
@@ -19,12 +21,22 @@ from ._datasource import (
 from ._utils import check_query
 
 if TYPE_CHECKING:
-    from ._datasource import DataFrameSource, DataSource, PolarsLazySource
+    from collections.abc import Mapping
+
+    from ._datasource import DataSource, PolarsLazySource
 
 
 class QueryExecutor(ABC):
     """Thin abstraction that tools use for query execution and validation."""
 
+    def __init__(self, sources: Mapping[str, DataSource]) -> None:
+        self._in_memory_tables = {
+            name
+            for name, source in sources.items()
+            if isinstance(source, DataFrameSource)
+        }
+        self._column_details: dict[tuple[str, int], list[ColumnMeta]] = {}
+
     @abstractmethod
     def execute_query(self, query: str) -> Any: ...
 
@@ -47,12 +59,29 @@ class QueryExecutor(ABC):
         self, table_name: str, columns: list[ColumnMeta], categorical_threshold: int
     ) -> None: ...
 
+    def is_in_memory(self, table_name: str) -> bool:
+        """Whether the table is a DataFrameSource held in memory."""
+        return table_name in self._in_memory_tables
+
     def get_column_details(
         self, table_name: str, categorical_threshold: int
     ) -> list[ColumnMeta]:
-        metas = self.get_column_metas(table_name)
-        self.populate_column_stats(table_name, metas, categorical_threshold)
-        return metas
+        # Column stats take a full scan per column. For DataFrameSource tables
+        # they are computed once per table and threshold; lazy frames and
+        # database tables read from storage that can change, so those are
+        # re-read on every call. Stats only describe the table to the LLM:
+        # query results always come from the live data.
+        key = (table_name, categorical_threshold)
+        if key not in self._column_details:
+            metas = self.get_column_metas(table_name)
+            self.populate_column_stats(table_name, metas, categorical_threshold)
+            if not self.is_in_memory(table_name):
+                return metas
+            self._column_details[key] = metas
+        return [
+            replace(meta, categories=list(meta.categories))
+            for meta in self._column_details[key]
+        ]
 
     def get_schema(self, table_name: str, categorical_threshold: int) -> str:
         return format_schema(
@@ -78,6 +107,7 @@ class DuckDBExecutor(QueryExecutor):
     """Shared DuckDB connection for multi-table DataFrameSource queries."""
 
     def __init__(self, sources: dict[str, DataFrameSource]):
+        super().__init__(sources)
         self._df_lib = get_shared_dataframe_backend(sources)
         self._conn = duckdb.connect(database=":memory:")
 
@@ -145,6 +175,7 @@ class PolarsSQLExecutor(QueryExecutor):
     def __init__(self, sources: dict[str, PolarsLazySource]):
         import polars as pl
 
+        super().__init__(sources)
         frames = {name: source.get_data() for name, source in sources.items()}
         self._ctx = pl.SQLContext(frames)
         self._sources = sources  # stored for schema delegation
@@ -195,6 +226,7 @@ class DataSourceExecutor(QueryExecutor):
     """
 
     def __init__(self, data_sources: dict[str, DataSource]):
+        super().__init__(data_sources)
         validate_source_group_compatibility(data_sources)
         self._data_sources = data_sources
         self._primary = next(iter(data_sources.values()))
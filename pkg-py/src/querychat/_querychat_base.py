@@ -5,7 +5,6 @@ from __future__ import annotations
 import contextlib
 import copy
 import os
-import re
 import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING, Generic, Literal, Optional
@@ -39,7 +38,13 @@ from ._querychat_core import (
 )
 from ._querychat_greeter import QueryChatGreeter
 from ._system_prompt import QueryChatSystemPrompt
-from ._utils import MISSING, MISSING_TYPE, is_ibis_backend, is_ibis_table
+from ._utils import (
+    MISSING,
+    MISSING_TYPE,
+    TABLE_NAME_PATTERN,
+    is_ibis_backend,
+    is_ibis_table,
+)
 from ._viz_utils import has_viz_deps, has_viz_tool
 from .tools import (
     ResetDashboardCallback,
@@ -457,9 +462,7 @@ class QueryChatBase(Generic[IntoFrameT]):
                 f"{type(include_in_greeting).__name__}."
             )
 
-        if not is_pins_board(data_source) and not re.match(
-            r"^[a-zA-Z][a-zA-Z0-9_]*$", table_name
-        ):
+        if not is_pins_board(data_source) and not TABLE_NAME_PATTERN.match(table_name):
             raise ValueError(
                 "Table name must begin with a letter and contain only "
                 "letters, numbers, and underscores"
@@ -585,7 +588,7 @@ class QueryChatBase(Generic[IntoFrameT]):
             raise ValueError("No tables found in database")
 
         for table_name in tables:
-            if not re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", table_name):
+            if not TABLE_NAME_PATTERN.match(table_name):
                 raise ValueError(
                     "Table name must begin with a letter and contain only "
                     "letters, numbers, and underscores"
@@ -770,7 +773,9 @@ def resolve_client(client: str | chatlas.Chat | None) -> chatlas.Chat:
 def create_client(client: chatlas.Chat) -> chatlas.Chat:
     """Clone a resolved Chat with empty conversation history."""
     chat = copy.deepcopy(client)
-    chat.set_turns([])
+    # Base clients are usually freshly constructed, so only reset when needed
+    if chat.get_turns():
+        chat.set_turns([])
     return chat
 
 
@@ -12,7 +12,7 @@ from shiny import App, Inputs, Outputs, Session, reactive, render, req, ui
 
 from ._icons import bs_icon
 from ._querychat_base import DEFAULT_TOOLS, TOOL_GROUPS, QueryChatBase, resolve_client
-from ._shiny_module import ServerValues, mod_server, mod_ui
+from ._shiny_module import ServerValues, mod_server, mod_ui, set_if_changed
 from ._utils import MISSING, MISSING_TYPE, as_narwhals
 from ._viz_utils import has_viz_tool
 
@@ -425,8 +425,9 @@ class QueryChat(QueryChatBase[IntoFrameT]):
                 name = active_table_name()
                 query = input.sql_editor()
                 default_query = f"SELECT * FROM {name}"
-                vals._tables[name].sql.set(
-                    query if query and query.strip() != default_query else None
+                set_if_changed(
+                    vals._tables[name].sql,
+                    query if query and query.strip() != default_query else None,
                 )
 
         return App(
@@ -994,7 +995,7 @@ class QueryChatExpress(QueryChatBase[IntoFrameT]):
         if query is None:
             return self._require_vals().sql()
         else:
-            return self._require_vals().sql.set(query)
+            return set_if_changed(self._require_vals().sql, query)
 
     @overload
     def title(self, value: None = None) -> str | None: ...
@@ -1028,7 +1029,7 @@ class QueryChatExpress(QueryChatBase[IntoFrameT]):
         if value is None:
             return self._require_vals().title()
         else:
-            return self._require_vals().title.set(value)
+            return set_if_changed(self._require_vals().title, value)
 
     def table(self, name: str) -> TableAccessor:
         """
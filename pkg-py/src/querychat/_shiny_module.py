@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import warnings
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,6 +22,7 @@ from ._viz_utils import has_viz_tool, preload_viz_deps_server, preload_viz_deps_
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from htmltools import HTMLDependency
     from shiny.bookmark import BookmarkState, RestoreState
 
     from shiny import Inputs, Outputs, Session
@@ -68,21 +70,27 @@ class TableState(Generic[IntoFrameT]):
     df: Callable[[], IntoFrameT]
 
 
-@module.ui
-def mod_ui(*, preload_viz: bool = False, **kwargs):
+@functools.cache
+def _head_assets() -> HTMLDependency:
+    # include_css()/include_js() stat, hash and copy the file on every call, so
+    # build the tags once per process rather than on every UI render.
     css_path = Path(__file__).parent / "static" / "css" / "styles.css"
     js_path = Path(__file__).parent / "static" / "js" / "querychat.js"
+    return ui.head_content(
+        ui.include_css(css_path),
+        ui.include_js(js_path),
+    )
+
 
+@module.ui
+def mod_ui(*, preload_viz: bool = False, **kwargs):
     kwargs.setdefault("enable_cancel", True)
     kwargs.setdefault("allow_attachments", True)
     tag = shinychat.chat_ui(CHAT_ID, **kwargs)
     tag.add_class("querychat")
 
     return ui.TagList(
-        ui.head_content(
-            ui.include_css(css_path),
-            ui.include_js(js_path),
-        ),
+        _head_assets(),
         tag,
         preload_viz_deps_ui() if preload_viz else None,
     )
@@ -91,6 +99,14 @@ def mod_ui(*, preload_viz: bool = False, **kwargs):
 class _MultiTableWarnReactive:
     """Proxy that warns once per session and delegates to the primary table's reactive value."""
 
+    __slots__ = (
+        "_accessor_name",
+        "_primary",
+        "_primary_table",
+        "_table_list",
+        "_warned",
+    )
+
     def __init__(
         self,
         primary: ReactiveStringOrNone,
@@ -119,8 +135,30 @@ class _MultiTableWarnReactive:
         self._warn()
         return self._primary.get()
 
-    def set(self, value: str | None) -> None:
-        self._primary.set(value)
+    def set(self, value: str | None) -> bool:
+        return set_if_changed(self._primary, value)
+
+
+def set_if_changed(
+    value: ReactiveStringOrNone | _MultiTableWarnReactive, new_value: str | None
+) -> bool:
+    """
+    Set a reactive string only if it differs from the current value.
+
+    ``reactive.Value.set()`` compares by identity, so an equal-but-distinct
+    string (e.g. the LLM re-emitting the same SQL) would still invalidate every
+    dependent. Comparing by equality first (in an isolated read, so no
+    dependency is taken) skips those redundant invalidations.
+
+    A ``_MultiTableWarnReactive`` proxy is set through its own ``set()``, which
+    applies the same check to the primary table's value.
+    """
+    if isinstance(value, _MultiTableWarnReactive):
+        return value.set(new_value)
+    with reactive.isolate():
+        if value.get() == new_value:
+            return False
+    return value.set(new_value)
 
 
 class ServerValues(Generic[IntoFrameT]):
@@ -238,15 +276,15 @@ def mod_server(
     def update_dashboard(data: UpdateDashboardData):
         table_name = data["table"]
         if table_name in table_states:
-            table_states[table_name].sql.set(data["query"])
-            table_states[table_name].title.set(data["title"])
-            _current_table.set(table_name)
+            set_if_changed(table_states[table_name].sql, data["query"])
+            set_if_changed(table_states[table_name].title, data["title"])
+            set_if_changed(_current_table, table_name)
 
     def reset_dashboard(table_name: str):
         if table_name in table_states:
-            table_states[table_name].sql.set(None)
-            table_states[table_name].title.set(None)
-            _current_table.set(table_name)
+            set_if_changed(table_states[table_name].sql, None)
+            set_if_changed(table_states[table_name].title, None)
+            set_if_changed(_current_table, table_name)
 
     viz_widgets: list[VizWidgetEntry] = []
 
@@ -349,9 +387,9 @@ def mod_server(
         new_query = update.get("query") or None  # "" → None (reset)
         new_title = update.get("title") or None
         if table_name and table_name in table_states:
-            table_states[table_name].sql.set(new_query)
-            table_states[table_name].title.set(new_title)
-            _current_table.set(table_name)
+            set_if_changed(table_states[table_name].sql, new_query)
+            set_if_changed(table_states[table_name].title, new_title)
+            set_if_changed(_current_table, table_name)
 
     def build_state_snapshot() -> dict[str, Any]:
         snapshot: dict[str, Any] = {}
@@ -7,12 +7,28 @@ from typing import TYPE_CHECKING
 import chevron
 import yaml
 
+from ._utils import read_text_cached, tokenize_template
 from ._viz_utils import has_viz_tool
 
 if TYPE_CHECKING:
     from ._data_dict import DataDict
     from ._datasource import DataSource
 
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+
+class _BundledPartials(dict):
+    """Mustache partials read from the bundled prompts directory on first use."""
+
+    def __missing__(self, name: str) -> str:
+        path = PROMPTS_DIR / f"{name}.md"
+        partial = read_text_cached(path) if path.is_file() else ""
+        self[name] = partial
+        return partial
+
+
+_PARTIALS = _BundledPartials()
+
 
 class QueryChatSystemPrompt:
     """Manages system prompt template and component assembly."""
@@ -77,24 +93,25 @@ class QueryChatSystemPrompt:
             )
 
         if prompt_template is None:
-            prompt_template = Path(__file__).parent / "prompts" / "prompt.md"
+            prompt_template = PROMPTS_DIR / "prompt.md"
         self.template = (
-            prompt_template.read_text()
+            read_text_cached(prompt_template)
             if isinstance(prompt_template, Path)
             else prompt_template
         )
 
         self.data_description = (
-            data_description.read_text()
+            read_text_cached(data_description)
             if isinstance(data_description, Path)
             else data_description
         )
         self.extra_instructions = (
-            extra_instructions.read_text()
+            read_text_cached(extra_instructions)
             if isinstance(extra_instructions, Path)
             else extra_instructions
         )
         self.categorical_threshold = categorical_threshold
+        self._rendered: dict[frozenset[str] | None, str] = {}
 
     def _generate_tables_overview(self) -> str:
         lines = []
@@ -169,6 +186,10 @@ class QueryChatSystemPrompt:
         """
         Render system prompt with tool configuration.
 
+        The rendered prompt is memoized per tool set, so every session sharing
+        this instance gets a byte-identical prompt (keeping provider-side prompt
+        caches warm) without re-querying the data sources.
+
         Args:
             tools: Normalized set of tool groups to enable (already normalized by caller)
 
@@ -176,6 +197,12 @@ class QueryChatSystemPrompt:
             Fully rendered system prompt string
 
         """
+        key = frozenset(tools) if tools is not None else None
+        if key not in self._rendered:
+            self._rendered[key] = self._render(tools)
+        return self._rendered[key]
+
+    def _render(self, tools: set[str] | None) -> str:
         first_source = next(iter(self._data_sources.values()), None)
         db_type = first_source.get_db_type() if first_source is not None else "SQL"
         # Data dicts can carry global (table-less) descriptions, so they may
@@ -210,12 +237,8 @@ class QueryChatSystemPrompt:
             "multi_table": len(self._data_sources) > 1,
         }
 
-        prompts_dir = str(Path(__file__).parent / "prompts")
         return chevron.render(
-            self.template,
-            context,
-            partials_path=prompts_dir,
-            partials_ext="md",
+            tokenize_template(self.template), context, partials_dict=_PARTIALS
         )
 
     @property
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import inspect
 import os
 import re
 import warnings
@@ -9,18 +11,26 @@ from typing import TYPE_CHECKING, Any, Literal, Optional, overload
 
 import chevron
 import narwhals.stable.v1 as nw
-from great_tables import GT
+from chatlas import Tool
+from chatlas._tools import func_to_basemodel
+from narwhals.stable.v1.dependencies import is_polars_dataframe
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import TypeGuard
 
     import ibis
     import pandas as pd
     import polars as pl
+    from chatlas.types import ToolAnnotations
     from ibis.backends.sql import SQLBackend
     from narwhals.stable.v1.typing import IntoFrame
+    from pydantic import BaseModel
 
 
+TABLE_NAME_PATTERN = re.compile(r"\A[a-zA-Z][a-zA-Z0-9_]*\Z")
+"""Valid SQL table names: a letter followed by letters, digits, or underscores."""
+
 _SCHEMA_DUMP_PATTERN = re.compile(
     r"^\s*[\{\[]|'additionalProperties'|\"additionalProperties\"",
 )
@@ -332,17 +342,28 @@ def df_to_html(df, maxrows: int = 5) -> str:
         HTML string representation of the table
 
     """
-    # Get row count and limited data, handling ibis vs narwhals
+    # great_tables is slow to import and only needed to render tool results
+    from great_tables import GT
+
+    # Get row count and limited data, handling ibis vs narwhals. For lazy
+    # inputs, a short head means the whole result fit, so skip the count query.
     if is_ibis_table(df):
-        nrow_full = df.count().execute()
         df_short = df.limit(maxrows).execute()
+        nrow_full = len(df_short) if len(df_short) < maxrows else df.count().execute()
     else:
         if not isinstance(df, (nw.DataFrame, nw.LazyFrame)):
             df = nw.from_native(df)
         if isinstance(df, nw.DataFrame):
-            df = df.lazy()
-        nrow_full = df.select(nw.len()).collect().item()
-        df_short = df.head(maxrows).collect().to_native()
+            nrow_full = len(df)
+            df_short = df.head(maxrows).to_native()
+        else:
+            head = df.head(maxrows).collect()
+            nrow_full = (
+                len(head)
+                if len(head) < maxrows
+                else df.select(nw.len()).collect().item()
+            )
+            df_short = head.to_native()
 
     # Generate HTML table
     table_html = GT(df_short).as_raw_html(make_page=False)
@@ -354,11 +375,61 @@ def df_to_html(df, maxrows: int = 5) -> str:
 
 def to_polars(data: IntoFrame) -> pl.DataFrame:
     """Convert any narwhals-compatible frame to a polars DataFrame."""
+    if is_polars_dataframe(data):
+        return data
     return as_narwhals(data).to_polars()
 
 
+@functools.lru_cache(maxsize=64)
 def read_prompt_template(filename: str, **kwargs: object) -> str:
-    """Read and interpolate a prompt template file."""
-    template_path = Path(__file__).parent / "prompts" / filename
-    template = template_path.read_text()
-    return chevron.render(template, kwargs)
+    """
+    Read and interpolate a bundled prompt template file.
+
+    The bundled prompts never change at runtime and are rendered with a handful
+    of distinct ``kwargs`` (e.g. ``db_type``), so results are cached.
+    """
+    template = read_text_cached(Path(__file__).parent / "prompts" / filename)
+    return chevron.render(tokenize_template(template), kwargs)
+
+
+def read_text_cached(path: Path) -> str:
+    """Read a text file, reusing its contents until the file changes on disk."""
+    return _read_text(path, path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_text(path: Path, mtime_ns: int) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+_TOOL_MODELS: dict[tuple[str, str], type[BaseModel]] = {}
+
+
+def tool_from_func(
+    func: Callable[..., Any], *, name: str, annotations: ToolAnnotations
+) -> Tool:
+    """
+    ``Tool.from_func()`` that builds the parameter model once per signature.
+
+    Every session builds fresh tool closures, but a tool's signature rarely
+    changes, so the pydantic model derived from it is reused for the same name
+    and signature. ``Tool.from_func()`` still validates the model against each
+    function and takes the description from ``func.__doc__``.
+    """
+    key = (name, str(inspect.signature(func)))
+    if key not in _TOOL_MODELS:
+        _TOOL_MODELS[key] = func_to_basemodel(func)
+    return Tool.from_func(
+        func, name=name, model=_TOOL_MODELS[key], annotations=annotations
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def tokenize_template(template: str) -> tuple[tuple[str, str], ...]:
+    """
+    Tokenize a mustache template once so repeated renders skip the parser.
+
+    ``chevron.render()`` accepts the returned tokens in place of the template
+    string.
+    """
+    return tuple(chevron.tokenizer.tokenize(template))
@@ -19,7 +19,12 @@ from shiny import ui
 
 from .__version import __version__
 from ._icons import bs_icon
-from ._utils import querychat_tool_starts_open, read_prompt_template, truncate_error
+from ._utils import (
+    querychat_tool_starts_open,
+    read_prompt_template,
+    tool_from_func,
+    truncate_error,
+)
 from ._viz_altair_widget import AltairWidget, fit_chart_to_container
 from ._viz_ggsql import execute_ggsql
 
@@ -87,7 +92,7 @@ def tool_visualize(
         multi_table=multi_table,
     )
 
-    return Tool.from_func(
+    return tool_from_func(
         impl,
         name="querychat_visualize",
         annotations={"title": "Query Visualization"},
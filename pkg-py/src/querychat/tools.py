@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import html
 import json
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Protocol, TypedDict, runtime_checkable
 
+import orjson
 from chatlas import ContentToolRequest, ContentToolResult, Tool
 from htmltools import HTMLDependency, TagList, tags
 from pydantic import Field
@@ -19,6 +21,7 @@ from ._utils import (
     df_to_html,
     querychat_tool_starts_open,
     read_prompt_template,
+    tool_from_func,
     truncate_error,
 )
 from ._viz_tools import tool_visualize
@@ -47,6 +50,52 @@ class GetSchemaResult(ContentToolResult):
     columns: list[ColumnMeta] = Field(default_factory=list)
 
 
+_QUERY_MAX_ROWS = 1000
+"""Most result rows the query tool hands back to the model."""
+
+_VALIDATED_QUERIES_MAX = 16
+"""How many validated dashboard queries each session remembers."""
+
+
+class _QueryResult(ContentToolResult):
+    """Tool result whose row records are serialized for the model with orjson."""
+
+    total_rows: int | None = None
+    """Row count of the full result, set only when ``value`` was truncated."""
+
+    def get_model_value(self) -> object:
+        if (
+            self.error
+            or not isinstance(self.value, list)
+            or self.model_format not in ("auto", "json")
+        ):
+            return super().get_model_value()
+        records = orjson.dumps(
+            self.value, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+        if self.total_rows is None:
+            return records
+        return (
+            f"{records}\n\nOnly the first {len(self.value)} of {self.total_rows} "
+            "rows are shown. Aggregate or filter in SQL instead of reading "
+            "individual rows."
+        )
+
+
+def _json_default(obj: Any) -> str:
+    # pandas Timestamp/Timedelta, Decimal, and other scalars orjson doesn't know
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _sql_error_result(markdown: str, error: str) -> ContentToolResult:
+    """Failed tool result: the SQL block followed by the (truncated) error."""
+    return ContentToolResult(
+        value=f"{markdown}\n\n> Error: {error}", error=Exception(error)
+    )
+
+
 def _col_to_dict(col: ColumnMeta) -> dict[str, Any]:
     return {
         "name": col.name,
@@ -153,7 +202,7 @@ def tool_get_schema(
     impl = _get_schema_impl(data_dicts, executor, table_names, categorical_threshold)
     description = read_prompt_template("tool-get-schema.md")
     impl.__doc__ = description
-    return Tool.from_func(
+    return tool_from_func(
         impl,
         name="querychat_get_schema",
         annotations={"title": "Get Schema"},
@@ -217,15 +266,29 @@ class UpdateDashboardData(TypedDict):
     title: str
 
 
+# Shared by the Apply Filter and Reset Filter buttons; querychat.js applies
+# the button's data-* attributes when clicked. Fill with escaped values only.
+_FILTER_BUTTON_HTML = """<button
+    class="btn btn-outline-primary btn-sm float-end mt-3 querychat-update-dashboard-btn"
+    data-table="{table}"
+    data-query="{query}"
+    data-title="{title}">
+    {label}
+</button>"""
+
+
 def _update_dashboard_impl(
     executor: QueryExecutor,
     table_names: list[str],
     update_fn: Callable[[UpdateDashboardData], None],
 ) -> Callable[[str, str, str], ContentToolResult]:
     """Create the implementation function for updating the dashboard."""
+    # The LLM often re-emits a query it already applied (e.g. only retitling
+    # it), so remember the latest queries that passed validation. Only for
+    # in-memory tables: a database schema can change while the app runs.
+    validated: OrderedDict[tuple[str, str], None] = OrderedDict()
 
     def update_dashboard(table: str, query: str, title: str) -> ContentToolResult:
-        error = None
         markdown = f"```sql\n{query}\n```"
         value = "Dashboard updated. Use `query` tool to review results, if needed."
 
@@ -233,29 +296,34 @@ def _update_dashboard_impl(
         if table not in table_names:
             available = ", ".join(table_names)
             error = f"Table '{table}' not found. Available: {available}"
-            markdown += f"\n\n> Error: {error}"
-            return ContentToolResult(value=markdown, error=Exception(error))
+            return _sql_error_result(markdown, error)
 
         try:
             # Test the query but don't execute it yet
-            executor.test_query(query, table_name=table, require_all_columns=True)
+            key = (table, query)
+            if key in validated:
+                validated.move_to_end(key)
+            else:
+                executor.test_query(query, table_name=table, require_all_columns=True)
+                if executor.is_in_memory(table):
+                    validated[key] = None
+                    if len(validated) > _VALIDATED_QUERIES_MAX:
+                        validated.popitem(last=False)
 
             # Add Apply Filter button
-            button_html = f"""<button
-                class="btn btn-outline-primary btn-sm float-end mt-3 querychat-update-dashboard-btn"
-                data-table="{html.escape(table, quote=True)}"
-                data-query="{html.escape(query, quote=True)}"
-                data-title="{html.escape(title, quote=True)}">
-                Apply Filter
-            </button>"""
+            button_html = _FILTER_BUTTON_HTML.format(
+                table=html.escape(table, quote=True),
+                query=html.escape(query, quote=True),
+                title=html.escape(title, quote=True),
+                label="Apply Filter",
+            )
 
             # Call the callback with TypedDict data on success
             update_fn({"table": table, "query": query, "title": title})
 
         except Exception as e:
             error = truncate_error(str(e))
-            markdown += f"\n\n> Error: {error}"
-            return ContentToolResult(value=markdown, error=Exception(error))
+            return _sql_error_result(markdown, error)
 
         # Return ContentToolResult with display metadata
         return ContentToolResult(
@@ -310,7 +378,7 @@ def tool_update_dashboard(
     )
     impl.__doc__ = description
 
-    return Tool.from_func(
+    return tool_from_func(
         impl,
         name="querychat_update_dashboard",
         annotations={"title": "Update Dashboard"},
@@ -336,13 +404,12 @@ def _reset_dashboard_impl(
         reset_fn(table)
 
         # Add Reset Filter button
-        button_html = f"""<button
-            class="btn btn-outline-primary btn-sm float-end mt-3 querychat-update-dashboard-btn"
-            data-table="{html.escape(table, quote=True)}"
-            data-query=""
-            data-title="">
-            Reset Filter
-        </button>"""
+        button_html = _FILTER_BUTTON_HTML.format(
+            table=html.escape(table, quote=True),
+            query="",
+            title="",
+            label="Reset Filter",
+        )
 
         # Return ContentToolResult with display metadata
         return ContentToolResult(
@@ -386,7 +453,7 @@ def tool_reset_dashboard(
     description = read_prompt_template("tool-reset-dashboard.md")
     impl.__doc__ = description
 
-    return Tool.from_func(
+    return tool_from_func(
         impl,
         name="querychat_reset_dashboard",
         annotations={"title": "Reset Dashboard"},
@@ -401,26 +468,30 @@ def _query_impl(executor: QueryExecutor) -> Callable[..., ContentToolResult]:
         collapsed: bool | None = None,  # noqa: FBT001 (LLM tool parameter)
         _intent: str = "",
     ) -> ContentToolResult:
-        error = None
         markdown = f"```sql\n{query}\n```"
         value = None
 
         try:
             result_df = executor.execute_query(query)
             nw_df = as_narwhals(result_df)
-            value = nw_df.rows(named=True)
+            total_rows = len(nw_df)
+            truncated = total_rows > _QUERY_MAX_ROWS
+            records_df = nw_df.head(_QUERY_MAX_ROWS) if truncated else nw_df
+            value = records_df.rows(named=True)
 
-            tbl_html = df_to_html(result_df, maxrows=5)
-            markdown += "\n\n" + str(tbl_html)
+            # Preview from the collected frame: handing over the lazy/ibis
+            # result would re-run the query for its head and row count.
+            tbl_html = df_to_html(nw_df, maxrows=5)
+            markdown = f"{markdown}\n\n{tbl_html}"
 
         except Exception as e:
             error = truncate_error(str(e))
-            markdown += f"\n\n> Error: {error}"
-            return ContentToolResult(value=markdown, error=Exception(error))
+            return _sql_error_result(markdown, error)
 
         # Return ContentToolResult with display metadata
-        return ContentToolResult(
+        return _QueryResult(
             value=value,
+            total_rows=total_rows if truncated else None,
             extra={
                 "display": ToolResultDisplay(
                     markdown=markdown,
@@ -463,7 +534,7 @@ def tool_query(executor: QueryExecutor, *, multi_table: bool = False) -> Tool:
     )
     impl.__doc__ = description
 
-    return Tool.from_func(
+    return tool_from_func(
         impl,
         name="querychat_query",
         annotations={"title": "Query Data"},
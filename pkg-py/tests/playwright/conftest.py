@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import errno
 import importlib.util
 import logging
 import socket
@@ -14,6 +15,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from shinychat.playwright import ChatController
 
 # Configure logging for test debugging
 logger = logging.getLogger(__name__)
@@ -28,7 +30,6 @@ if TYPE_CHECKING:
     from collections.abc import Generator
 
     from playwright.sync_api import Page
-    from shinychat.playwright import ChatController as ChatControllerType
 
 
 def _find_free_port() -> int:
@@ -40,6 +41,9 @@ def _find_free_port() -> int:
     grab the port in between. This is mitigated by:
     1. Using SO_REUSEADDR to allow quick reuse of the port
     2. The _start_server_with_retry() wrapper which retries with a new port on failure
+
+    Servers that can adopt an already-bound socket should use _bind_free_socket()
+    instead, which has no such race.
     """
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -49,34 +53,96 @@ def _find_free_port() -> int:
     return port
 
 
+def _bind_free_socket() -> socket.socket:
+    """
+    Bind a listening socket to a port assigned by the OS.
+
+    The socket is handed to the server as-is (uvicorn and werkzeug can both adopt
+    one), so the port is never released between choosing it and serving on it.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class AppProcessExitedError(RuntimeError):
+    """An app's server process exited before it started serving."""
+
+
+_PORT_ERRNOS = {errno.EADDRINUSE, errno.EACCES}
+
+
+def _is_port_error(error: Exception) -> bool:
+    """
+    Whether a failed server start might succeed on a different port.
+
+    Bind failures surface as an OSError with EADDRINUSE/EACCES, as Gradio's
+    errno-less "Cannot find empty port" OSError, or as the server process
+    exiting (Streamlit). Anything else -- an error in the app itself, or a server
+    that never answers -- would fail the same way on a fresh port.
+    """
+    if isinstance(error, AppProcessExitedError):
+        return True
+    if not isinstance(error, OSError):
+        return False
+    if error.errno in _PORT_ERRNOS:
+        # EACCES with a filename is a file permission problem, not the port
+        return error.filename is None
+    return error.errno is None and "Cannot find empty port" in str(error)
+
+
 def _wait_for_app_ready(
     url: str,
     timeout: float = 30.0,
     poll_interval: float = 0.1,
+    process: subprocess.Popen | None = None,
 ) -> None:
     """
     Poll an HTTP endpoint until it responds successfully.
 
+    The delay between polls starts small and doubles up to `poll_interval`, so
+    apps that come up quickly are detected almost immediately while slower ones
+    aren't polled at a constant rate for their whole startup.
+
     Args:
-        url: The URL to poll (e.g., "http://localhost:8765")
+        url: The URL to poll (e.g., "http://127.0.0.1:8765")
         timeout: Maximum time to wait in seconds
-        poll_interval: Time between polls in seconds
+        poll_interval: Maximum time between polls in seconds
+        process: The server's subprocess, if it runs in one. Checked before
+            each poll so a crashed server fails immediately instead of after
+            the full timeout.
 
     Raises:
         TimeoutError: If the app doesn't respond within the timeout
+        AppProcessExitedError: If `process` exits before the app responds
 
     """
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
     last_error: Exception | None = None
+    interval = min(0.025, poll_interval)
 
-    while time.time() - start_time < timeout:
+    while (remaining := deadline - time.monotonic()) > 0:
+        if process is not None and process.poll() is not None:
+            raise AppProcessExitedError(
+                f"App process for {url} exited with code {process.returncode} "
+                "before becoming ready"
+            )
         try:
-            with urllib.request.urlopen(url, timeout=poll_interval + 1) as response:
+            # Allow a slow first response, but never past the overall deadline
+            request_timeout = min(poll_interval + 1, remaining)
+            with urllib.request.urlopen(url, timeout=request_timeout) as response:
                 if response.status == 200:
                     return
         except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError) as e:
             last_error = e
-            time.sleep(poll_interval)
+            time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
+            interval = min(interval * 2, poll_interval)
 
     raise TimeoutError(
         f"App at {url} did not become ready within {timeout}s. Last error: {last_error}"
@@ -90,7 +156,10 @@ def _start_server_with_retry(
     max_attempts: int = 3,
 ):
     """
-    Start a server with retry logic for reliability.
+    Start a server, retrying on a new port if the port may have been taken.
+
+    Only failures that a different port could fix are retried (see
+    _is_port_error()); any other startup error is raised immediately.
 
     Args:
         start_fn_factory: Function that returns (url, start_fn) tuple.
@@ -111,7 +180,8 @@ def _start_server_with_retry(
         try:
             url, start_fn = start_fn_factory()
             result = start_fn()
-            _wait_for_app_ready(url, timeout=timeout)
+            process = next((r for r in result if isinstance(r, subprocess.Popen)), None)
+            _wait_for_app_ready(url, timeout=timeout, process=process)
             return url, *result
         except Exception as e:
             last_error = e
@@ -125,6 +195,8 @@ def _start_server_with_retry(
                         attempt + 1,
                         cleanup_error,
                     )
+            if not _is_port_error(e):
+                raise
             logger.warning(
                 "Server startup attempt %d/%d failed: %s",
                 attempt + 1,
@@ -132,7 +204,8 @@ def _start_server_with_retry(
                 e,
             )
             # Small delay before retry
-            time.sleep(0.5)
+            if attempt + 1 < max_attempts:
+                time.sleep(0.5)
 
     raise RuntimeError(
         f"Failed to start server after {max_attempts} attempts. "
@@ -140,10 +213,28 @@ def _start_server_with_retry(
     )
 
 
-def _create_chat_controller(page: Page, table_name: str) -> ChatControllerType:
-    """Create a ChatController for a querychat chat component."""
-    from shinychat.playwright import ChatController
+def _serve_app(
+    start_fn_factory,
+    cleanup_fn,
+    timeout: float,
+) -> Generator[str, None, None]:
+    """
+    Start a server via _start_server_with_retry() and yield its URL.
 
+    The server is cleaned up with `cleanup_fn` when the generator is closed, so an
+    app fixture can simply `yield from` one of the _serve_*_app() helpers below.
+    """
+    url, *result = _start_server_with_retry(
+        start_fn_factory, cleanup_fn, timeout=timeout
+    )
+    try:
+        yield url
+    finally:
+        cleanup_fn(*result)
+
+
+def _create_chat_controller(page: Page, table_name: str) -> ChatController:
+    """Create a ChatController for a querychat chat component."""
     # Chat ID format: {module_id}-{chat_id}
     # module_id = "querychat_{table_name}" (from QueryChat)
     # chat_id = "chat" (from CHAT_ID constant in _shiny_module.py)
@@ -189,14 +280,22 @@ def _load_shiny_app(app_path: str) -> Any:
         return module.app
 
 
-def _start_shiny_app_threaded(app_path: str, port: int) -> tuple[threading.Thread, Any]:
-    """Start a Shiny app in a background thread."""
+def _start_shiny_app_threaded(
+    app_path: str, sock: socket.socket
+) -> tuple[threading.Thread, Any]:
+    """Start a Shiny app in a background thread, serving on `sock`."""
     import uvicorn
 
-    app = _load_shiny_app(app_path)
-    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    try:
+        app = _load_shiny_app(app_path)
+    except Exception:
+        sock.close()
+        raise
+    config = uvicorn.Config(app, log_level="warning")
     server = uvicorn.Server(config)
-    thread = threading.Thread(target=server.run, daemon=True)
+    thread = threading.Thread(
+        target=server.run, kwargs={"sockets": [sock]}, daemon=True
+    )
     thread.start()
     return thread, server
 
@@ -206,114 +305,64 @@ def _stop_shiny_server(server: Any) -> None:
     server.should_exit = True
 
 
-@pytest.fixture(scope="module")
-def app_01_hello() -> Generator[str, None, None]:
-    """Start the 01-hello-app.py Shiny server for testing."""
-    app_path = str(EXAMPLES_DIR / "01-hello-app.py")
+def _serve_shiny_app(app_path: Path) -> Generator[str, None, None]:
+    """Serve a Shiny app for the lifetime of a fixture."""
 
     def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_shiny_app_threaded(app_path, port)
+        sock = _bind_free_socket()
+        url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        return url, lambda: _start_shiny_app_threaded(str(app_path), sock)
 
     def shiny_cleanup(_thread, server):
         _stop_shiny_server(server)
 
-    url, _thread, server = _start_server_with_retry(
-        start_factory, shiny_cleanup, timeout=30.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_shiny_server(server)
+    return _serve_app(start_factory, shiny_cleanup, timeout=30.0)
+
+
+@pytest.fixture(scope="session")
+def app_01_hello() -> Generator[str, None, None]:
+    """Start the 01-hello-app.py Shiny server for testing."""
+    yield from _serve_shiny_app(EXAMPLES_DIR / "01-hello-app.py")
 
 
 @pytest.fixture
-def chat_01_hello(page: Page) -> ChatControllerType:
+def chat_01_hello(page: Page) -> ChatController:
     """Create a ChatController for the 01-hello-app chat component."""
     return _create_chat_controller(page, "titanic")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def app_02_prompt() -> Generator[str, None, None]:
     """Start the 02-prompt-app.py Shiny server for testing."""
-    app_path = str(EXAMPLES_DIR / "02-prompt-app.py")
-
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_shiny_app_threaded(app_path, port)
-
-    def shiny_cleanup(_thread, server):
-        _stop_shiny_server(server)
-
-    url, _thread, server = _start_server_with_retry(
-        start_factory, shiny_cleanup, timeout=30.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_shiny_server(server)
+    yield from _serve_shiny_app(EXAMPLES_DIR / "02-prompt-app.py")
 
 
 @pytest.fixture
-def chat_02_prompt(page: Page) -> ChatControllerType:
+def chat_02_prompt(page: Page) -> ChatController:
     """Create a ChatController for the 02-prompt-app chat component."""
     return _create_chat_controller(page, "titanic")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def app_03_express() -> Generator[str, None, None]:
     """Start the 03-sidebar-express-app.py Shiny server for testing."""
-    app_path = str(EXAMPLES_DIR / "03-sidebar-express-app.py")
-
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_shiny_app_threaded(app_path, port)
-
-    def shiny_cleanup(_thread, server):
-        _stop_shiny_server(server)
-
-    url, _thread, server = _start_server_with_retry(
-        start_factory, shiny_cleanup, timeout=30.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_shiny_server(server)
+    yield from _serve_shiny_app(EXAMPLES_DIR / "03-sidebar-express-app.py")
 
 
 @pytest.fixture
-def chat_03_express(page: Page) -> ChatControllerType:
+def chat_03_express(page: Page) -> ChatController:
     """Create a ChatController for the 03-sidebar-express-app chat component."""
     return _create_chat_controller(page, "titanic")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def app_03_core() -> Generator[str, None, None]:
     """Start the 03-sidebar-core-app.py Shiny server for testing."""
-    app_path = str(EXAMPLES_DIR / "03-sidebar-core-app.py")
-
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_shiny_app_threaded(app_path, port)
-
-    def shiny_cleanup(_thread, server):
-        _stop_shiny_server(server)
-
-    url, _thread, server = _start_server_with_retry(
-        start_factory, shiny_cleanup, timeout=30.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_shiny_server(server)
+    yield from _serve_shiny_app(EXAMPLES_DIR / "03-sidebar-core-app.py")
 
 
 @pytest.fixture
-def chat_03_core(page: Page) -> ChatControllerType:
+def chat_03_core(page: Page) -> ChatController:
     """Create a ChatController for the 03-sidebar-core-app chat component."""
     return _create_chat_controller(page, "titanic")
 
@@ -359,13 +408,27 @@ def _stop_streamlit_server(process: subprocess.Popen) -> None:
             process.kill()
 
 
+def _serve_streamlit_app(app_path: Path) -> Generator[str, None, None]:
+    """Serve a Streamlit app for the lifetime of a fixture."""
+
+    def start_factory():
+        port = _find_free_port()
+        url = f"http://127.0.0.1:{port}"
+        return url, lambda: _start_streamlit_app_subprocess(str(app_path), port)
+
+    def streamlit_cleanup(process, _):
+        _stop_streamlit_server(process)
+
+    return _serve_app(start_factory, streamlit_cleanup, timeout=45.0)
+
+
 @pytest.fixture
 def app_04_streamlit() -> Generator[str, None, None]:
     """
     Start the 04-streamlit-app.py Streamlit server for testing.
 
-    Function-scoped (a fresh subprocess per test), unlike the Shiny/Gradio/Dash
-    app fixtures in this file. A single Streamlit server was observed to stop
+    Function-scoped (a fresh subprocess per test), unlike the session-scoped
+    Shiny/Gradio/Dash app fixtures in this file. A single Streamlit server was observed to stop
     re-running its script for new browser sessions after the first test's
     session completed successfully -- the static page shell still loads, but
     no reactive content (e.g. the chat greeting) ever streams in, with no
@@ -373,45 +436,13 @@ def app_04_streamlit() -> Generator[str, None, None]:
     server's life (a fresh browser context/page doesn't recover it; only a
     new server process does).
     """
-    app_path = str(EXAMPLES_DIR / "04-streamlit-app.py")
-
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_streamlit_app_subprocess(app_path, port)
-
-    def streamlit_cleanup(process, _):
-        _stop_streamlit_server(process)
-
-    url, process, _ = _start_server_with_retry(
-        start_factory, streamlit_cleanup, timeout=45.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_streamlit_server(process)
+    yield from _serve_streamlit_app(EXAMPLES_DIR / "04-streamlit-app.py")
 
 
 @pytest.fixture
 def app_09_streamlit_custom() -> Generator[str, None, None]:
     """Start the 09-streamlit-custom-app.py Streamlit server for testing. Function-scoped; see app_04_streamlit()."""
-    app_path = str(EXAMPLES_DIR / "09-streamlit-custom-app.py")
-
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_streamlit_app_subprocess(app_path, port)
-
-    def streamlit_cleanup(process, _):
-        _stop_streamlit_server(process)
-
-    url, process, _ = _start_server_with_retry(
-        start_factory, streamlit_cleanup, timeout=45.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_streamlit_server(process)
+    yield from _serve_streamlit_app(EXAMPLES_DIR / "09-streamlit-custom-app.py")
 
 
 def _load_gradio_app(app_path: str) -> Any:
@@ -468,48 +499,30 @@ def _stop_gradio_server(app: Any) -> None:
         app.close()
 
 
-@pytest.fixture(scope="module")
-def app_05_gradio() -> Generator[str, None, None]:
-    """Start the 05-gradio-app.py Gradio server for testing."""
-    app_path = str(EXAMPLES_DIR / "05-gradio-app.py")
+def _serve_gradio_app(app_path: Path) -> Generator[str, None, None]:
+    """Serve a Gradio app for the lifetime of a fixture."""
 
     def start_factory():
         port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_gradio_app_threaded(app_path, port)
+        url = f"http://127.0.0.1:{port}"
+        return url, lambda: _start_gradio_app_threaded(str(app_path), port)
 
     def gradio_cleanup(_, server):
         _stop_gradio_server(server)
 
-    url, _, server = _start_server_with_retry(
-        start_factory, gradio_cleanup, timeout=45.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_gradio_server(server)
+    return _serve_app(start_factory, gradio_cleanup, timeout=45.0)
 
 
-@pytest.fixture(scope="module")
-def app_07_gradio_custom() -> Generator[str, None, None]:
-    """Start the 07-gradio-custom-app.py Gradio server for testing."""
-    app_path = str(EXAMPLES_DIR / "07-gradio-custom-app.py")
-
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_gradio_app_threaded(app_path, port)
+@pytest.fixture(scope="session")
+def app_05_gradio() -> Generator[str, None, None]:
+    """Start the 05-gradio-app.py Gradio server for testing."""
+    yield from _serve_gradio_app(EXAMPLES_DIR / "05-gradio-app.py")
 
-    def gradio_cleanup(_, server):
-        _stop_gradio_server(server)
 
-    url, _, server = _start_server_with_retry(
-        start_factory, gradio_cleanup, timeout=45.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_gradio_server(server)
+@pytest.fixture(scope="session")
+def app_07_gradio_custom() -> Generator[str, None, None]:
+    """Start the 07-gradio-custom-app.py Gradio server for testing."""
+    yield from _serve_gradio_app(EXAMPLES_DIR / "07-gradio-custom-app.py")
 
 
 def _load_dash_app(app_path: str) -> Any:
@@ -545,12 +558,19 @@ def _load_dash_app(app_path: str) -> Any:
     )
 
 
-def _start_dash_app_threaded(app_path: str, port: int) -> tuple[threading.Thread, Any]:
-    """Start a Dash app in a thread (same process for testing)."""
+def _start_dash_app_threaded(
+    app_path: str, sock: socket.socket
+) -> tuple[threading.Thread, Any]:
+    """Start a Dash app in a thread (same process for testing), serving on `sock`."""
     from werkzeug.serving import make_server
 
-    dash_app = _load_dash_app(app_path)
-    server = make_server("127.0.0.1", port, dash_app.server, threaded=True)
+    # make_server() dups the descriptor, so our handle can be closed either way
+    with sock:
+        dash_app = _load_dash_app(app_path)
+        host, port = sock.getsockname()
+        server = make_server(
+            host, port, dash_app.server, threaded=True, fd=sock.fileno()
+        )
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     return thread, server
@@ -561,73 +581,39 @@ def _stop_dash_server(server: Any) -> None:
     server.shutdown()
 
 
-@pytest.fixture(scope="module")
-def app_06_dash() -> Generator[str, None, None]:
-    """Start the 06-dash-app.py Dash server for testing."""
-    app_path = str(EXAMPLES_DIR / "06-dash-app.py")
+def _serve_dash_app(app_path: Path) -> Generator[str, None, None]:
+    """Serve a Dash app for the lifetime of a fixture."""
 
     def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_dash_app_threaded(app_path, port)
+        sock = _bind_free_socket()
+        url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        return url, lambda: _start_dash_app_threaded(str(app_path), sock)
 
     def dash_cleanup(_thread, server):
         _stop_dash_server(server)
 
-    url, _thread, server = _start_server_with_retry(
-        start_factory, dash_cleanup, timeout=45.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_dash_server(server)
+    return _serve_app(start_factory, dash_cleanup, timeout=45.0)
 
 
-@pytest.fixture(scope="module")
-def app_08_dash_custom() -> Generator[str, None, None]:
-    """Start the 08-dash-custom-app.py Dash server for testing."""
-    app_path = str(EXAMPLES_DIR / "08-dash-custom-app.py")
+@pytest.fixture(scope="session")
+def app_06_dash() -> Generator[str, None, None]:
+    """Start the 06-dash-app.py Dash server for testing."""
+    yield from _serve_dash_app(EXAMPLES_DIR / "06-dash-app.py")
 
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_dash_app_threaded(app_path, port)
 
-    def dash_cleanup(_thread, server):
-        _stop_dash_server(server)
-
-    url, _thread, server = _start_server_with_retry(
-        start_factory, dash_cleanup, timeout=45.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_dash_server(server)
+@pytest.fixture(scope="session")
+def app_08_dash_custom() -> Generator[str, None, None]:
+    """Start the 08-dash-custom-app.py Dash server for testing."""
+    yield from _serve_dash_app(EXAMPLES_DIR / "08-dash-custom-app.py")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def app_10_viz() -> Generator[str, None, None]:
     """Start the 10-viz-app.py Shiny server for testing."""
-    app_path = str(EXAMPLES_DIR / "10-viz-app.py")
-
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_shiny_app_threaded(app_path, port)
-
-    def shiny_cleanup(_thread, server):
-        _stop_shiny_server(server)
-
-    url, _thread, server = _start_server_with_retry(
-        start_factory, shiny_cleanup, timeout=30.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_shiny_server(server)
+    yield from _serve_shiny_app(EXAMPLES_DIR / "10-viz-app.py")
 
 
 @pytest.fixture
-def chat_10_viz(page: Page) -> ChatControllerType:
+def chat_10_viz(page: Page) -> ChatController:
     """Create a ChatController for the 10-viz-app chat component."""
     return _create_chat_controller(page, "titanic")
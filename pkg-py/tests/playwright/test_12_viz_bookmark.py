@@ -26,10 +26,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent))
 from conftest import (
     _create_chat_controller,
-    _find_free_port,
-    _start_server_with_retry,
-    _start_shiny_app_threaded,
-    _stop_shiny_server,
+    _serve_shiny_app,
 )
 
 VIZ_PROMPT = "Use the visualize tool to create a scatter plot of age vs fare"
@@ -40,23 +37,7 @@ APPS_DIR = Path(__file__).parent / "apps"
 @pytest.fixture(scope="module")
 def app_viz_bookmark() -> Generator[str, None, None]:
     """Start the viz bookmark test app with server-side bookmarking."""
-    app_path = str(APPS_DIR / "viz_bookmark_app.py")
-
-    def start_factory():
-        port = _find_free_port()
-        url = f"http://localhost:{port}"
-        return url, lambda: _start_shiny_app_threaded(app_path, port)
-
-    def shiny_cleanup(_thread, server):
-        _stop_shiny_server(server)
-
-    url, _thread, server = _start_server_with_retry(
-        start_factory, shiny_cleanup, timeout=30.0
-    )
-    try:
-        yield url
-    finally:
-        _stop_shiny_server(server)
+    yield from _serve_shiny_app(APPS_DIR / "viz_bookmark_app.py")
 
 
 @pytest.fixture
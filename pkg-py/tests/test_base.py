@@ -146,6 +146,19 @@ class TestCreateClient:
         assert result is not chat
         assert len(result.get_turns()) == 0
 
+    def test_clears_history_but_keeps_system_prompt(self):
+        chat = chatlas.ChatOpenAI(system_prompt="Be brief.")
+        chat.set_turns(
+            [
+                chatlas.Turn(role="user", contents="Hi"),
+                chatlas.Turn(role="assistant", contents="Hello"),
+            ]
+        )
+        result = create_client(chat)
+        assert len(result.get_turns()) == 0
+        assert result.system_prompt == "Be brief."
+        assert len(chat.get_turns()) == 2
+
 
 class TestNormalizeTools:
     def test_with_none_returns_none(self):
@@ -218,6 +231,9 @@ class TestQueryChatBase:
         with pytest.raises(ValueError, match="Table name must begin with a letter"):
             QueryChatBase(sample_df, "table-with-dash")
 
+        with pytest.raises(ValueError, match="Table name must begin with a letter"):
+            QueryChatBase(sample_df, "trailing_newline\n")
+
     def test_system_prompt_property(self, sample_df):
         qc = QueryChatBase(sample_df, "test_table")
         prompt = qc.system_prompt
@@ -117,3 +117,15 @@ def test_df_to_html_with_truncation(sample_dataframe):
     # Should show truncation message
     assert "Showing 3 of 5 rows" in html_output
     assert "<table" in html_output
+
+
+@pytest.mark.parametrize(("maxrows", "truncated"), [(3, True), (5, False), (10, False)])
+def test_df_to_html_with_lazy_frame(maxrows, truncated):
+    """Lazy inputs report the full row count only when the preview is truncated."""
+    pl = pytest.importorskip("polars")
+    lf = pl.LazyFrame({"id": [1, 2, 3, 4, 5]})
+
+    html_output = df_to_html(lf, maxrows=maxrows)
+
+    assert "<table" in html_output
+    assert ("of 5 rows" in html_output) is truncated
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import narwhals.stable.v1 as nw
 import pandas as pd
@@ -448,6 +449,68 @@ def test_datasource_executor_get_schema() -> None:
     assert "val" in schema
 
 
+def test_get_column_details_is_cached_per_table_and_threshold() -> None:
+    df = pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    source = DataFrameSource(nw.from_native(df), "t")
+    executor = DataSourceExecutor({"t": source})
+
+    with patch.object(
+        source, "populate_column_stats", wraps=source.populate_column_stats
+    ) as populate:
+        first = executor.get_column_details("t", categorical_threshold=10)
+        assert executor.get_column_details("t", categorical_threshold=10) == first
+        assert populate.call_count == 1
+
+        executor.get_column_details("t", categorical_threshold=2)
+        assert populate.call_count == 2
+
+    assert first[1].categories == ["a", "b", "c"]
+
+
+def test_get_column_details_is_reread_for_database_sources(sqlite_sources) -> None:
+    executor = DataSourceExecutor(sqlite_sources)
+    first = executor.get_column_details("customers", categorical_threshold=10)
+    assert first[1].categories == ["Alice", "Bob", "Charlie"]
+
+    engine = sqlite_sources["customers"].engine
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO customers (id, name) VALUES (40, 'Dana')"))
+
+    again = executor.get_column_details("customers", categorical_threshold=10)
+    assert again[1].categories == ["Alice", "Bob", "Charlie", "Dana"]
+
+
+def test_get_column_details_returns_copies_of_cached_stats() -> None:
+    df = pl.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    executor = DuckDBExecutor({"t": DataFrameSource(nw.from_native(df), "t")})
+
+    first = executor.get_column_details("t", categorical_threshold=10)
+    first[1].categories.append("z")
+    first[1].description = "changed"
+
+    again = executor.get_column_details("t", categorical_threshold=10)
+    assert again[1].categories == ["a", "b", "c"]
+    assert again[1].description is None
+
+
+def test_get_column_details_is_reread_for_lazy_sources(
+    orders_polars_source, customers_polars_source
+) -> None:
+    executor = PolarsSQLExecutor(
+        {"orders": orders_polars_source, "customers": customers_polars_source}
+    )
+
+    with patch.object(
+        customers_polars_source,
+        "populate_column_stats",
+        wraps=customers_polars_source.populate_column_stats,
+    ) as populate:
+        executor.get_column_details("customers", categorical_threshold=10)
+        executor.get_column_details("customers", categorical_threshold=10)
+
+    assert populate.call_count == 2
+
+
 def test_duckdb_executor_get_column_metas() -> None:
     df1 = pl.DataFrame({"id": [1, 2], "val": [10.0, 20.0]})
     df2 = pl.DataFrame({"id": [1, 2], "name": ["a", "b"]})
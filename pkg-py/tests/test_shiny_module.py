@@ -7,7 +7,7 @@ from unittest.mock import patch
 
 import pytest
 
-from shiny import ui
+from shiny import reactive, ui
 
 
 @pytest.fixture(autouse=True)
@@ -326,3 +326,45 @@ def test_shinychat_chat_contract_used_by_mod_server():
 
     assert _on_save in chat.history._save_callbacks
     assert _on_restore in chat.history._restore_callbacks
+
+
+def test_set_if_changed_skips_equal_values():
+    """Equal-but-distinct strings should not invalidate reactive dependents."""
+    from querychat._shiny_module import ReactiveStringOrNone, set_if_changed
+
+    value = ReactiveStringOrNone(None)
+    query = "SELECT * FROM t"
+
+    assert set_if_changed(value, query) is True
+    # Build an equal string at runtime so it is not the same object
+    prefix = "SELECT * "
+    assert set_if_changed(value, prefix + "FROM t") is False
+    with reactive.isolate():
+        assert value.get() is query
+
+    assert set_if_changed(value, None) is True
+    assert set_if_changed(value, None) is False
+
+
+def test_set_if_changed_sets_multi_table_proxy_through_its_set():
+    from querychat._shiny_module import (
+        ReactiveStringOrNone,
+        _MultiTableWarnReactive,
+        set_if_changed,
+    )
+
+    primary = ReactiveStringOrNone(None)
+    proxy = _MultiTableWarnReactive(primary, "sql", "orders", "'orders', 'items'")
+
+    with patch.object(
+        _MultiTableWarnReactive,
+        "set",
+        autospec=True,
+        side_effect=_MultiTableWarnReactive.set,
+    ) as proxy_set:
+        assert set_if_changed(proxy, "SELECT 1") is True
+        assert set_if_changed(proxy, "SELECT 1") is False
+
+    assert proxy_set.call_count == 2
+    with reactive.isolate():
+        assert primary.get() == "SELECT 1"
@@ -1,5 +1,6 @@
 """Unit tests for QueryChatSystemPrompt class."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -148,6 +149,27 @@ class TestQueryChatSystemPromptInit:
         finally:
             template_path.unlink()
 
+    def test_init_with_path_template_rereads_changed_file(
+        self, sample_data_source, tmp_path
+    ):
+        """Cached template reads are invalidated when the file changes on disk."""
+        template_path = tmp_path / "prompt.md"
+        template_path.write_text("First: {{db_type}}")
+        os.utime(template_path, ns=(1_000_000_000, 1_000_000_000))
+
+        prompt = QueryChatSystemPrompt(
+            prompt_template=template_path, data_source=sample_data_source
+        )
+        assert prompt.template == "First: {{db_type}}"
+
+        template_path.write_text("Second: {{db_type}}")
+        os.utime(template_path, ns=(2_000_000_000, 2_000_000_000))
+
+        prompt = QueryChatSystemPrompt(
+            prompt_template=template_path, data_source=sample_data_source
+        )
+        assert prompt.template == "Second: {{db_type}}"
+
     def test_init_with_string_data_description(
         self, sample_data_source, sample_prompt_template
     ):
@@ -334,6 +356,31 @@ class TestQueryChatSystemPromptRender:
         assert "Database Type:" in rendered
         assert sample_data_source.get_db_type() in rendered
 
+    def test_render_is_memoized_per_tool_set(
+        self, sample_data_source, sample_prompt_template, monkeypatch
+    ):
+        """Repeated renders reuse the cached prompt instead of re-querying sources."""
+        prompt = QueryChatSystemPrompt(
+            prompt_template=sample_prompt_template,
+            data_source=sample_data_source,
+        )
+        calls = []
+        original = sample_data_source.get_db_type
+
+        def counting_get_db_type():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(sample_data_source, "get_db_type", counting_get_db_type)
+
+        first = prompt.render({"query", "update"})
+        assert prompt.render({"update", "query"}) is first
+        assert len(calls) == 1
+
+        assert prompt.render({"query"}) != first
+        assert prompt.render(None) == prompt.render(None)
+        assert len(calls) == 3
+
 
 class TestVizPromptConditionals:
     """Tests for visualization-related conditional rendering in the real prompt."""
@@ -11,12 +11,19 @@ from htmltools import TagList
 from querychat._data_dict import ColumnRange, ColumnSpec, DataDict, TableSpec
 from querychat._datasource import DataFrameSource
 from querychat._query_executor import DataSourceExecutor
-from querychat._utils import querychat_tool_starts_open
+from querychat._utils import (
+    querychat_tool_starts_open,
+    read_prompt_template,
+    tool_from_func,
+)
 from querychat.tools import (
     GetSchemaResult,
     UpdateDashboardData,
     _get_schema_impl,
     _query_impl,
+    _reset_dashboard_impl,
+    _update_dashboard_impl,
+    tool_query,
     tool_reset_dashboard,
 )
 from shinychat import message_content_chunk
@@ -67,6 +74,113 @@ class TestQueryCollapsedParameter:
         assert result.extra["display"].open is True
 
 
+def test_query_result_model_value_is_json_with_pandas_scalars():
+    """Timestamps in query results reach the model as JSON, not a Python repr."""
+    import json
+
+    df = nw.from_native(
+        pd.DataFrame(
+            {
+                "when": pd.to_datetime(["2024-01-02"]),
+                "n": [3],
+            }
+        )
+    )
+    source = DataFrameSource(df, "events")
+    query_fn = _query_impl(DataSourceExecutor({"events": source}))
+
+    result = query_fn("SELECT * FROM events")
+
+    assert isinstance(result.value, list)
+    records = json.loads(str(result.get_model_value()))
+    assert records == [{"when": "2024-01-02T00:00:00", "n": 3}]
+
+
+def test_query_result_caps_rows_sent_to_model(monkeypatch):
+    """Large results are truncated for the model, with a note giving the full count."""
+    import json
+
+    monkeypatch.setattr("querychat.tools._QUERY_MAX_ROWS", 2)
+    df = nw.from_native(pd.DataFrame({"x": [1, 2, 3, 4, 5]}))
+    query_fn = _query_impl(DataSourceExecutor({"t": DataFrameSource(df, "t")}))
+
+    result = query_fn("SELECT * FROM t ORDER BY x")
+
+    assert result.value == [{"x": 1}, {"x": 2}]
+    records, note = str(result.get_model_value()).split("\n\n", 1)
+    assert json.loads(records) == [{"x": 1}, {"x": 2}]
+    assert "first 2 of 5 rows" in note
+
+    small = query_fn("SELECT * FROM t WHERE x < 3")
+    assert json.loads(str(small.get_model_value())) == [{"x": 1}, {"x": 2}]
+
+
+def test_query_result_honors_model_format():
+    """Non-JSON model formats fall back to the base ContentToolResult handling."""
+    df = nw.from_native(pd.DataFrame({"x": [1, 2]}))
+    query_fn = _query_impl(DataSourceExecutor({"t": DataFrameSource(df, "t")}))
+
+    result = query_fn("SELECT * FROM t ORDER BY x")
+
+    as_is = result.model_copy(update={"model_format": "as_is"})
+    assert as_is.get_model_value() == [{"x": 1}, {"x": 2}]
+    as_str = result.model_copy(update={"model_format": "str"})
+    assert as_str.get_model_value() == str([{"x": 1}, {"x": 2}])
+
+
+def test_read_prompt_template_is_cached_per_arguments():
+    first = read_prompt_template("tool-query.md", db_type="DuckDB", multi_table=False)
+    again = read_prompt_template("tool-query.md", db_type="DuckDB", multi_table=False)
+    other = read_prompt_template("tool-query.md", db_type="SQLite", multi_table=False)
+
+    assert again is first
+    assert "DuckDB" in first
+    assert "SQLite" in other
+
+
+def test_tool_schema_is_reused_across_constructions(executor):
+    first = tool_query(executor).schema["function"]
+    second = tool_query(executor).schema["function"]
+    other = tool_query(executor, multi_table=True).schema["function"]
+
+    assert second == first
+    assert second["parameters"] is not first["parameters"]
+    assert other["parameters"] == first["parameters"]
+    assert other["description"] != first["description"]
+
+
+def test_tool_schema_cache_is_keyed_on_signature():
+    from unittest.mock import patch
+
+    from querychat import _utils
+
+    def make_narrow():
+        def impl(query: str) -> str:
+            """Run a query."""
+            return query
+
+        return impl
+
+    def make_wide():
+        def impl(query: str, limit: int = 10) -> str:
+            """Run a query."""
+            return query
+
+        return impl
+
+    with patch.object(
+        _utils, "func_to_basemodel", wraps=_utils.func_to_basemodel
+    ) as to_model:
+        first = tool_from_func(make_narrow(), name="test_sig_tool", annotations={})
+        again = tool_from_func(make_narrow(), name="test_sig_tool", annotations={})
+        wider = tool_from_func(make_wide(), name="test_sig_tool", annotations={})
+
+    assert to_model.call_count == 2
+    assert again.schema == first.schema
+    assert "limit" not in first.schema["function"]["parameters"]["properties"]
+    assert "limit" in wider.schema["function"]["parameters"]["properties"]
+
+
 def test_querychat_tool_starts_open_default_behavior(monkeypatch):
     """Test default behavior when no setting is provided."""
     monkeypatch.delenv("QUERYCHAT_TOOL_DETAILS", raising=False)
@@ -132,6 +246,87 @@ def test_querychat_tool_starts_open_invalid_setting(monkeypatch):
         assert result is False  # Falls back to default behavior
 
 
+def test_update_dashboard_button_escapes_attributes(executor):
+    update_fn = _update_dashboard_impl(executor, ["test_table"], lambda data: None)
+
+    result = update_fn("test_table", "SELECT * FROM test_table WHERE x > 1", 'A & "B"')
+
+    markdown = result.extra["display"].markdown
+    assert 'data-table="test_table"' in markdown
+    assert 'data-query="SELECT * FROM test_table WHERE x &gt; 1"' in markdown
+    assert 'data-title="A &amp; &quot;B&quot;"' in markdown
+    assert "Apply Filter" in markdown
+
+
+def test_update_dashboard_skips_revalidating_the_same_query(executor, monkeypatch):
+    calls = []
+    test_query = executor.test_query
+
+    def counting_test_query(query, **kwargs):
+        calls.append(query)
+        return test_query(query, **kwargs)
+
+    monkeypatch.setattr(executor, "test_query", counting_test_query)
+    update_fn = _update_dashboard_impl(executor, ["test_table"], lambda data: None)
+
+    update_fn("test_table", "SELECT * FROM test_table WHERE x > 1", "Big x")
+    update_fn("test_table", "SELECT * FROM test_table WHERE x > 1", "Renamed")
+    update_fn("test_table", "SELECT * FROM test_table WHERE x > 2", "Bigger x")
+
+    assert calls == [
+        "SELECT * FROM test_table WHERE x > 1",
+        "SELECT * FROM test_table WHERE x > 2",
+    ]
+
+
+def test_update_dashboard_remembers_only_recent_queries(executor, monkeypatch):
+    calls = []
+    test_query = executor.test_query
+
+    def counting_test_query(query, **kwargs):
+        calls.append(query)
+        return test_query(query, **kwargs)
+
+    monkeypatch.setattr(executor, "test_query", counting_test_query)
+    monkeypatch.setattr("querychat.tools._VALIDATED_QUERIES_MAX", 1)
+    update_fn = _update_dashboard_impl(executor, ["test_table"], lambda data: None)
+
+    update_fn("test_table", "SELECT * FROM test_table WHERE x > 1", "Big x")
+    update_fn("test_table", "SELECT * FROM test_table WHERE x > 2", "Bigger x")
+    update_fn("test_table", "SELECT * FROM test_table WHERE x > 1", "Big x")
+
+    assert len(calls) == 3
+
+
+def test_update_dashboard_revalidates_database_queries(executor, monkeypatch):
+    calls = []
+    test_query = executor.test_query
+
+    def counting_test_query(query, **kwargs):
+        calls.append(query)
+        return test_query(query, **kwargs)
+
+    monkeypatch.setattr(executor, "test_query", counting_test_query)
+    monkeypatch.setattr(executor, "is_in_memory", lambda table_name: False)
+    update_fn = _update_dashboard_impl(executor, ["test_table"], lambda data: None)
+
+    update_fn("test_table", "SELECT * FROM test_table WHERE x > 1", "Big x")
+    update_fn("test_table", "SELECT * FROM test_table WHERE x > 1", "Renamed")
+
+    assert len(calls) == 2
+
+
+def test_reset_dashboard_button_clears_query_and_title():
+    reset_fn = _reset_dashboard_impl(lambda table: None, ["orders"])
+
+    markdown = reset_fn("orders").extra["display"].markdown
+
+    assert 'data-table="orders"' in markdown
+    assert 'data-query=""' in markdown
+    assert 'data-title=""' in markdown
+    assert "Reset Filter" in markdown
+
+
 def test_update_dashboard_data_has_table_field():
     """Test that UpdateDashboardData includes table field."""
     # TypedDict should have table as a key